@@ -1,12 +1,24 @@
-from fastapi import FastAPI, Query, HTTPException
+import asyncio
+import os
+
+import anyio
+from fastapi import FastAPI, Query, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse
 from datetime import date, timedelta
 
+from nhl_predictor import nhl_api
 from nhl_predictor.main import run_predictions
 
-app = FastAPI(title="NHL Odds Predictor")
+app = FastAPI(title="NHL Odds Predictor", default_response_class=ORJSONResponse)
+
+# Precomputed payloads keyed by ISO date; refreshed by the background task so
+# the hot path of /api/predictions is a dict lookup.
+PREDICTIONS: dict[str, dict] = {}
+PRECOMPUTE_DAYS = 4  # today + next 3 days
+REFRESH_INTERVAL_S = 600
+CLEANUP_INTERVAL_S = 900
 
 app.add_middleware(
     CORSMiddleware,
@@ -27,8 +39,48 @@ def home():
 def default_tomorrow_str() -> str:
     return (date.today() + timedelta(days=1)).isoformat()
 
+
+async def _refresh_loop() -> None:
+    """Recompute predictions for today and the next few days every 10 minutes."""
+    while True:
+        for i in range(PRECOMPUTE_DAYS):
+            d = date.today() + timedelta(days=i)
+            try:
+                PREDICTIONS[d.isoformat()] = await run_predictions(d)
+            except Exception:
+                # Keep serving the last good payload; try again next cycle.
+                pass
+        await asyncio.sleep(REFRESH_INTERVAL_S)
+
+
+async def _cleanup_loop() -> None:
+    """Expire precomputed entries for past dates and stale API responses."""
+    while True:
+        await asyncio.sleep(CLEANUP_INTERVAL_S)
+        today_str = date.today().isoformat()
+        for key in [k for k in PREDICTIONS if k < today_str]:
+            del PREDICTIONS[key]
+        # The response cache only overwrites on re-fetch; without this sweep
+        # every URL ever probed would stay resident for the process lifetime.
+        await nhl_api.purge_expired_responses()
+
+
+@app.on_event("startup")
+async def start_precompute():
+    # Bound the default threadpool (40 threads out of the box); it only
+    # handles our small file reads via asyncio.to_thread.
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = int(os.getenv("ANYIO_THREADS", "8"))
+    asyncio.create_task(_refresh_loop())
+    asyncio.create_task(_cleanup_loop())
+
+
+@app.on_event("shutdown")
+async def close_http_client():
+    await nhl_api.aclose()
+
 @app.get("/api/predictions")
-def predictions(date_str: str = Query(default=None, alias="date")):
+async def predictions(response: Response, date_str: str = Query(default=None, alias="date")):
     """Return predictions for a specific date.
 
     - If `date` is provided (YYYY-MM-DD), run predictions for that date.
@@ -45,7 +97,16 @@ def predictions(date_str: str = Query(default=None, alias="date")):
         except ValueError:
             raise HTTPException(status_code=400, detail="Date must be YYYY-MM-DD")
 
-    return run_predictions(for_date)
+    # Served from the precompute store when possible; otherwise fall back to
+    # computing on demand (e.g. dates beyond the precompute window).
+    precomputed = PREDICTIONS.get(for_date.isoformat())
+    if precomputed is not None:
+        response.headers["X-Cache"] = "HIT"
+        return precomputed
+
+    # Observability: report whether this date's schedule was already cached.
+    response.headers["X-Cache"] = "HIT" if nhl_api.schedule_is_cached(for_date) else "MISS"
+    return await run_predictions(for_date)
 
 # Optional quick sanity check endpoint
 @app.get("/health")
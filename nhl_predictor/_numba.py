@@ -0,0 +1,86 @@
+"""
+Numba-compiled kernels for season-scale backtests and parameter sweeps.
+
+`run_slate` takes an [N, 18] feature matrix (column order documented in
+`model.FEATURE_COLUMNS`) plus the weight vector and book margin, and returns
+(probs, home_odds, away_odds) for the whole slate with a parallel prange
+loop. Compiled code is cached on disk (cache=True) so only the first run
+pays the JIT cost. `model.predict_slate` falls back to the NumPy kernel when
+numba is not installed; importing this module requires it.
+"""
+
+import numpy as np
+from numba import int64, njit, prange
+
+from .model import WEIGHT_ORDER
+
+# Weight-vector indices, derived from the shared packing order in model.py
+# so a reorder there can't silently skew these kernels.
+_HOME_ICE = WEIGHT_ORDER.index("home_ice")
+_L10 = WEIGHT_ORDER.index("last_10")
+_SEASON = WEIGHT_ORDER.index("season_record")
+_GOALIE = WEIGHT_ORDER.index("goalie")
+_SPECIAL = WEIGHT_ORDER.index("special_teams")
+_H2H = WEIGHT_ORDER.index("head_to_head")
+_GOAL_DIFF = WEIGHT_ORDER.index("goal_diff")
+_SHOTS = WEIGHT_ORDER.index("shots")
+_XG = WEIGHT_ORDER.index("xg")
+_INJURY = WEIGHT_ORDER.index("injury")
+
+
+@njit(cache=True)
+def _predict(f, w):
+    """Scalar probability for one feature row f ([18]) and weight vector w ([10])."""
+    prob = 0.5 + w[_HOME_ICE]
+    prob += w[_L10] * (f[0] - f[1])
+    prob += w[_SEASON] * (f[2] - f[3])
+    goalie_diff = f[4] - f[5]
+    if not np.isnan(goalie_diff):
+        prob += w[_GOALIE] * goalie_diff * 10.0
+    prob += w[_SPECIAL] * (f[6] - f[7]) * 5.0
+    if f[9] > 0:
+        prob += w[_H2H] * (f[8] - 0.5) * 2.0
+    prob += w[_GOAL_DIFF] * (f[12] - f[13])
+    if f[10] != 0.0 or f[11] != 0.0:
+        shot_diff = (f[10] - f[11]) / 15.0
+        if shot_diff > 1.0:
+            shot_diff = 1.0
+        elif shot_diff < -1.0:
+            shot_diff = -1.0
+        prob += w[_SHOTS] * shot_diff
+    prob += w[_XG] * (f[14] - f[15])
+    prob += w[_INJURY] * (f[17] - f[16])
+    if prob < 0.01:
+        return 0.01
+    if prob > 0.99:
+        return 0.99
+    return prob
+
+
+@njit(cache=True)
+def _to_american(prob):
+    """Mirror of odds.probability_to_american_odds."""
+    p = prob
+    if p < 0.001:
+        p = 0.001
+    elif p > 0.999:
+        p = 0.999
+    if p >= 0.5:
+        return -int64(round((p / (1.0 - p)) * 100.0))
+    return int64(round(((1.0 - p) / p) * 100.0))
+
+
+@njit(parallel=True, cache=True)
+def run_slate(features, weights, book_margin):
+    """Compute (probs, home_odds, away_odds) for an [N, 18] feature matrix."""
+    n = features.shape[0]
+    probs = np.empty(n, dtype=np.float64)
+    home_odds = np.empty(n, dtype=np.int64)
+    away_odds = np.empty(n, dtype=np.int64)
+    scale = 1.0 + book_margin
+    for i in prange(n):
+        p = _predict(features[i], weights)
+        probs[i] = p
+        home_odds[i] = _to_american(p * scale)
+        away_odds[i] = _to_american((1.0 - p) * scale)
+    return probs, home_odds, away_odds
@@ -0,0 +1,53 @@
+"""ANSI color helpers for the CLI summary (approximate team primary colors)."""
+
+RESET = "\033[0m"
+BOLD = "\033[1m"
+
+TEAM_COLORS: dict[str, str] = {
+    # Eastern
+    "BOS": "\033[33m",  # yellow
+    "BUF": "\033[34m",
+    "DET": "\033[31m",
+    "FLA": "\033[31m",
+    "MTL": "\033[31m",
+    "OTT": "\033[31m",
+    "TBL": "\033[36m",
+    "TOR": "\033[34m",
+    "CAR": "\033[31m",
+    "CBJ": "\033[34m",
+    "NJD": "\033[31m",
+    "NYI": "\033[34m",
+    "NYR": "\033[34m",
+    "PHI": "\033[33m",
+    "PIT": "\033[33m",
+    "WSH": "\033[31m",
+    # Western
+    "ANA": "\033[33m",
+    "ARI": "\033[31m",
+    "CGY": "\033[31m",
+    "CHI": "\033[31m",
+    "COL": "\033[35m",
+    "DAL": "\033[32m",
+    "EDM": "\033[34m",
+    "LAK": "\033[37m",
+    "MIN": "\033[32m",
+    "NSH": "\033[33m",
+    "SEA": "\033[36m",
+    "SJS": "\033[36m",
+    "STL": "\033[34m",
+    "VAN": "\033[32m",
+    "VGK": "\033[33m",
+    "WPG": "\033[36m",
+}
+
+# Fully rendered labels, built once at import: the print loop reduces to a
+# dict lookup (NHL feeds already give uppercase abbrevs, so the common case
+# skips .upper() too).
+TEAM_LABEL_CACHE: dict[str, str] = {
+    abbr: f"{BOLD}{code}{abbr}{RESET}" for abbr, code in TEAM_COLORS.items()
+}
+
+
+def color_team(abbrev: str) -> str:
+    label = TEAM_LABEL_CACHE.get(abbrev) or TEAM_LABEL_CACHE.get(abbrev.upper())
+    return label if label is not None else f"{BOLD}\033[37m{abbrev}{RESET}"
@@ -18,10 +18,24 @@ INJURIES_PATH = os.path.join(DATA_DIR, "injuries.json")
 # Output: predictions for the app
 PREDICTIONS_PATH = os.path.join(DATA_DIR, "predictions.json")
 
+# Persistent goalie name -> player id memo (player search results never change)
+GOALIE_NAME_IDS_PATH = os.path.join(DATA_DIR, "goalie_name_ids.json")
+
+# Per-date run_predictions results, so re-runs only compute new dates
+PREDICTIONS_CACHE_DIR = os.path.join(DATA_DIR, "cache")
+
 # Optional cache to avoid hitting NHL API every run
 STANDINGS_CACHE_PATH = os.path.join(DATA_DIR, "standings_cache.json")
 TEAM_STATS_CACHE_PATH = os.path.join(DATA_DIR, "team_stats_cache.json")
 
+# On-disk TTL (seconds) for persisted NHL API responses, so a restarted
+# worker warms up from files instead of the network. 0 disables persistence.
+NHL_CACHE_TTL = int(os.environ.get("NHL_CACHE_TTL", "900").strip() or 0)
+
+
+def club_schedule_cache_path(team_abbrev: str) -> str:
+    return os.path.join(DATA_DIR, f"club_schedule_{team_abbrev.upper()}.json")
+
 # NHL API bases (no API key required)
 NHL_WEB_BASE = "https://api-web.nhle.com/v1"
 NHL_STATS_BASE = "https://api.nhle.com/stats/rest/en"
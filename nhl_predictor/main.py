@@ -2,31 +2,45 @@
 Prediction runner.
 
 - `run_predictions()` returns a single-day payload for the API (date + games).
-- The CLI (`python -m nhl_predictor.main`) writes a multi-day `predictions.json` suitable for GitHub Pages.
+- The CLI (`python -m nhl_predictor.main`) delegates to `run_nhl_predictions.py`,
+  which writes a multi-day `predictions.json` suitable for GitHub Pages.
 """
 
+import asyncio
 import json
 import os
 from datetime import date, timedelta
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - stdlib json fallback
+    orjson = None
+
 from . import config
 from .nhl_api import (
     get_schedule,
     get_standings,
     get_team_stats_season,
-    get_goalie_save_pct,
+    get_goalie_save_pcts,
     search_player_id,
-    get_h2h_win_pct,
+    build_h2h_index,
+    h2h_from_index,
 )
 from .model import predict_game
 
 
+def _load_json_file(path: str) -> dict:
+    """Read a JSON dict from path ({} if missing), preferring orjson's parser."""
+    if not os.path.isfile(path):
+        return {}
+    with open(path, "rb") as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
 def load_starting_goalies() -> dict:
     """Load starting_goalies.json. Format: { "YYYY-MM-DD": [ { "gameId"?: id, "homeAbbrev", "awayAbbrev", "homeGoalieId"?: id, "awayGoalieId"?: id, "homeGoalieName"?: "Name", "awayGoalieName"?: "Name" } ] }."""
-    if not os.path.isfile(config.STARTING_GOALIES_PATH):
-        return {}
-    with open(config.STARTING_GOALIES_PATH, encoding="utf-8") as f:
-        return json.load(f)
+    return _load_json_file(config.STARTING_GOALIES_PATH)
 
 
 def load_injuries() -> dict:
@@ -34,23 +48,18 @@ def load_injuries() -> dict:
     Load injuries.json if present.
     Format: { "YYYY-MM-DD": [ { "team": "COL", "player": "Name", "isTopScorer": true } ] }
     """
-    if not os.path.isfile(config.INJURIES_PATH):
-        return {}
-    with open(config.INJURIES_PATH, encoding="utf-8") as f:
-        return json.load(f)
+    return _load_json_file(config.INJURIES_PATH)
 
 
-def get_goalie_sv_for_game(
+async def resolve_goalie_ids(
     game_date: str,
     home_abbrev: str,
     away_abbrev: str,
     game_id: int,
     starting_goalies: dict,
-) -> tuple[float | None, float | None]:
-    """Return (home_goalie_sv_pct, away_goalie_sv_pct) from starting goalies + NHL API."""
+) -> tuple[int | None, int | None]:
+    """Return (home_goalie_id, away_goalie_id) from starting goalies, resolving names via the NHL search API."""
     by_date = starting_goalies.get(game_date) or []
-    home_sv = None
-    away_sv = None
     for g in by_date:
         match_id = g.get("gameId") == game_id
         match_teams = (g.get("homeAbbrev") == home_abbrev and g.get("awayAbbrev") == away_abbrev)
@@ -59,20 +68,16 @@ def get_goalie_sv_for_game(
         hid = g.get("homeGoalieId")
         aid = g.get("awayGoalieId")
         if hid is None and g.get("homeGoalieName"):
-            hid = search_player_id(g["homeGoalieName"])
+            hid = await search_player_id(g["homeGoalieName"])
         if aid is None and g.get("awayGoalieName"):
-            aid = search_player_id(g["awayGoalieName"])
-        if hid is not None:
-            home_sv = get_goalie_save_pct(hid)
-        if aid is not None:
-            away_sv = get_goalie_save_pct(aid)
-        break
-    return home_sv, away_sv
+            aid = await search_player_id(g["awayGoalieName"])
+        return hid, aid
+    return None, None
 
 
 
 
-def run_predictions(for_date: date | None = None) -> dict:
+async def run_predictions(for_date: date | None = None) -> dict:
     """
     Fetch games for a specific date, compute odds, return payload for JSON.
 
@@ -82,17 +87,38 @@ def run_predictions(for_date: date | None = None) -> dict:
     if for_date is None:
         for_date = date.today() + timedelta(days=1)
     date_str = for_date.isoformat()
-    games = get_schedule(for_date)
+    # The three bootstrap fetches are independent; overlap them.
+    standings, team_stats, games = await asyncio.gather(
+        get_standings(), get_team_stats_season(), get_schedule(for_date)
+    )
     if not games:
         return {"date": date_str, "games": [], "message": "No upcoming games for this date."}
 
-    standings = get_standings()
-    team_stats = get_team_stats_season()
-    starting_goalies = load_starting_goalies()
-    injuries = load_injuries()
-
-    results = []
-    for g in games:
+    # File reads go through worker threads so they can't stall the event loop.
+    starting_goalies, injuries = await asyncio.gather(
+        asyncio.to_thread(load_starting_goalies),
+        asyncio.to_thread(load_injuries),
+    )
+
+    # Resolve every game's starting-goalie IDs, then batch-fetch the distinct
+    # save percentages once instead of one round trip per goalie per game.
+    id_pairs = await asyncio.gather(*(
+        resolve_goalie_ids(
+            date_str, g.get("homeAbbrev") or "", g.get("awayAbbrev") or "",
+            g.get("id"), starting_goalies,
+        )
+        for g in games
+    ))
+    needed_ids = {pid for pair in id_pairs for pid in pair if pid is not None}
+    sv_by_id = await get_goalie_save_pcts(needed_ids) if needed_ids else {}
+
+    # One pass over the slate teams' club schedules builds every H2H record;
+    # per-game lookups below are then dict reads.
+    slate_teams = {t for g in games for t in (g.get("homeAbbrev"), g.get("awayAbbrev")) if t}
+    h2h_index = await build_h2h_index(slate_teams)
+
+    def _enrich(g: dict, goalie_ids: tuple[int | None, int | None]) -> dict:
+        """Compute one game's odds from the prefetched slate data."""
         home_abbrev = g.get("homeAbbrev") or ""
         away_abbrev = g.get("awayAbbrev") or ""
         game_id = g.get("id")
@@ -105,16 +131,16 @@ def run_predictions(for_date: date | None = None) -> dict:
                 home_injury = max(home_injury, 1.0 if inj.get("isTopScorer") else 0.5)
             elif team == away_abbrev:
                 away_injury = max(away_injury, 1.0 if inj.get("isTopScorer") else 0.5)
-        home_sv, away_sv = get_goalie_sv_for_game(
-            date_str, home_abbrev, away_abbrev, game_id, starting_goalies
-        )
-        h2h_win_pct, h2h_games = get_h2h_win_pct(home_abbrev, away_abbrev)
+        hid, aid = goalie_ids
+        home_sv = sv_by_id.get(hid) if hid is not None else None
+        away_sv = sv_by_id.get(aid) if aid is not None else None
+        h2h_win_pct, h2h_games = h2h_from_index(h2h_index, home_abbrev, away_abbrev)
         prob, home_odds, away_odds = predict_game(
             home_abbrev, away_abbrev, standings, team_stats, home_sv, away_sv,
             h2h_home_win_pct=h2h_win_pct, h2h_games=h2h_games,
             home_injury=home_injury, away_injury=away_injury,
         )
-        results.append({
+        return {
             "gameId": game_id,
             "date": date_str,
             "homeTeam": home_abbrev,
@@ -122,94 +148,91 @@ def run_predictions(for_date: date | None = None) -> dict:
             "homeWinProb": round(prob, 3),
             "homeAmericanOdds": home_odds,
             "awayAmericanOdds": away_odds,
-        })
+        }
+
+    # All I/O happened above (batched goalie fetches + H2H index), so the
+    # per-game enrichment is pure compute now.
+    results = list(map(_enrich, games, id_pairs))
     return {"date": date_str, "games": results}
 
 
+def _prediction_cache_path(for_date: date) -> str:
+    return os.path.join(config.PREDICTIONS_CACHE_DIR, f"{for_date.isoformat()}.json")
+
+
+def _read_cached_payload(path: str) -> dict | None:
+    """Return the cached payload at path if it is fresh, else None."""
+    import time
+
+    try:
+        if os.path.getmtime(path) + config.NHL_CACHE_TTL <= time.time():
+            return None
+        with open(path, "rb") as f:
+            raw = f.read()
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except (OSError, ValueError):
+        return None
+
+
+async def cached_run_predictions(for_date: date) -> dict:
+    """
+    run_predictions with an on-disk per-date memo (nhl_data/cache/{date}.json,
+    NHL_CACHE_TTL freshness). Today and tomorrow are always recomputed since
+    their schedules still move; 0 TTL disables the cache entirely.
+    """
+    if config.NHL_CACHE_TTL <= 0 or for_date <= date.today() + timedelta(days=1):
+        return await run_predictions(for_date)
+    path = _prediction_cache_path(for_date)
+    payload = await asyncio.to_thread(_read_cached_payload, path)
+    if payload is not None:
+        return payload
+    payload = await run_predictions(for_date)
+    os.makedirs(config.PREDICTIONS_CACHE_DIR, exist_ok=True)
+    await asyncio.to_thread(_dump_json, payload, path)
+    return payload
+
+
+def _dump_json(payload: dict, path: str, pretty: bool = False) -> None:
+    """Serialize payload to path atomically, preferring orjson's fast encoder."""
+    tmp = f"{path}.tmp"
+    if orjson is not None:
+        with open(tmp, "wb") as f:
+            f.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2 if pretty else 0))
+    else:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(payload, f, indent=2 if pretty else None)
+    os.replace(tmp, path)
+
+
 def write_predictions(payload: dict) -> str:
     """Write payload to config.PREDICTIONS_PATH. Return path."""
     os.makedirs(config.DATA_DIR, exist_ok=True)
     path = config.PREDICTIONS_PATH
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(payload, f, indent=2)
+    _dump_json(payload, path, pretty=True)
     return path
 
 
-def write_predictions_multi(predictions: list[dict]) -> str:
-    """Write a multi-day payload to config.PREDICTIONS_PATH. Return path."""
+def write_predictions_multi(predictions: list[dict], pretty: bool = False) -> str:
+    """Write a multi-day payload to config.PREDICTIONS_PATH. Return path.
+
+    Compact by default (the file is machine-consumed); pass pretty=True for
+    indented output.
+    """
     os.makedirs(config.DATA_DIR, exist_ok=True)
     path = config.PREDICTIONS_PATH
     payload = {
         "generatedAt": date.today().isoformat(),
         "predictions": predictions,
     }
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(payload, f, indent=2)
+    _dump_json(payload, path, pretty=pretty)
     return path
 
 
 def main() -> None:
-    """CLI: build a multi-day predictions.json for static hosting."""
-    import sys
-
-    # Usage:
-    #   python -m nhl_predictor.main                -> tomorrow, 14 days
-    #   python -m nhl_predictor.main 2026-02-25     -> start date, 14 days
-    #   python -m nhl_predictor.main 2026-02-25 --days 21
-
-    start_date: date
-    days = 14
-
-    args = sys.argv[1:]
-
-    # parse optional start date
-    if args and not args[0].startswith("-"):
-        try:
-            start_date = date.fromisoformat(args[0])
-        except ValueError:
-            print("Usage: python -m nhl_predictor.main [YYYY-MM-DD] [--days N]")
-            sys.exit(1)
-        args = args[1:]
-    else:
-        start_date = date.today() + timedelta(days=1)
-
-    # parse --days N
-    if args:
-        for i, a in enumerate(args):
-            if a == "--days" and i + 1 < len(args):
-                try:
-                    days = int(args[i + 1])
-                except ValueError:
-                    print("--days must be an integer")
-                    sys.exit(1)
-                break
-
-    days = max(1, min(days, 60))
-
-    predictions: list[dict] = []
-    total_games = 0
-
-    for i in range(days):
-        d = start_date + timedelta(days=i)
-        payload = run_predictions(d)
-        games = payload.get("games", []) or []
-        predictions.append({
-            "date": payload.get("date") or d.isoformat(),
-            "games": games,
-        })
-        total_games += len(games)
-
-    path = write_predictions_multi(predictions)
-
-    non_empty = [p for p in predictions if p.get("games")]
-    print(f"Wrote {len(predictions)} day(s), {total_games} total game(s) to {path}")
-    if not non_empty:
-        print("No games scheduled in this window.")
-    else:
-        for block in non_empty:
-            print(f"\n{block['date']} — {len(block['games'])} game(s)")
-            for g in block["games"]:
-                print(f"  {g['awayTeam']} @ {g['homeTeam']}: Home {g['homeAmericanOdds']}, Away {g['awayAmericanOdds']}")
+    """CLI shim: the canonical multi-day CLI lives in run_nhl_predictions.py."""
+    from run_nhl_predictions import main as cli_main
+
+    cli_main()
 
 
 if __name__ == "__main__":
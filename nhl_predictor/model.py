@@ -2,10 +2,39 @@
 Combine 7 factors into a single home-win probability, then to American odds.
 Factors: (1) home/away, (2) last 10 W-L, (3) season W-L, (4) goalie save %, (5) special teams avg,
          (6) head-to-head this season, (7) shots on goal per game (proxy for shots/60).
+
+The arithmetic lives in a vectorized NumPy kernel (`predict_home_win_prob_batch`)
+so season-scale backtests and parameter sweeps compute whole slates at once;
+the scalar `predict_home_win_prob` is a thin wrapper over a length-1 batch.
 """
 
+import numpy as np
+
 from .odds import probability_to_american_odds
 
+# Column order for the [N, 18] feature matrices accepted by predict_slate
+# (and positionally by predict_home_win_prob_batch).
+FEATURE_COLUMNS = (
+    "home_l10_win_pct",
+    "away_l10_win_pct",
+    "home_season_win_pct",
+    "away_season_win_pct",
+    "home_goalie_sv_pct",
+    "away_goalie_sv_pct",
+    "home_special_avg",
+    "away_special_avg",
+    "h2h_home_win_pct",
+    "h2h_games",
+    "home_shots_per_game",
+    "away_shots_per_game",
+    "home_goal_diff_pg",
+    "away_goal_diff_pg",
+    "home_xg_per_game",
+    "away_xg_per_game",
+    "home_injury",
+    "away_injury",
+)
+
 # ========= TUNING PANEL =========
 # Adjust these integer weights to change how important each factor is.
 # The model internally divides by 100, so "10" means 0.10, "3" means 0.03, etc.
@@ -40,11 +69,119 @@ WEIGHT_INJURY = WEIGHT_CONFIG["injury"] / 100.0
 # Simple league-average shooting percentage used as an xG proxy
 LEAGUE_AVG_SHOT_PCT = 0.095
 
+# The single source of truth for how the weight vector is packed. The numba
+# kernel derives its positional indices from this tuple, and the batch kernel
+# stacks its per-factor deltas in the same order, so the coupling can't drift.
+WEIGHT_ORDER = (
+    "home_ice",
+    "last_10",
+    "season_record",
+    "goalie",
+    "special_teams",
+    "head_to_head",
+    "goal_diff",
+    "shots",
+    "xg",
+    "injury",
+)
+
+# Weights packed once at import into a single vector in WEIGHT_ORDER.
+_WEIGHTS = np.array([WEIGHT_CONFIG[k] for k in WEIGHT_ORDER], dtype=np.float64) / 100.0
+
+# Imported after WEIGHT_ORDER exists: _numba imports it back from this module,
+# and doing this at the top would turn that cycle into a spurious ImportError
+# that silently disables the accelerated kernel.
+try:
+    from . import _numba as _accel
+except ImportError:  # pragma: no cover - numba is optional
+    _accel = None
+
 
 def _norm(x: float, lo: float = 0.0, hi: float = 1.0) -> float:
     return max(lo, min(hi, x))
 
 
+def predict_home_win_prob_batch(
+    home_l10_win_pct,
+    away_l10_win_pct,
+    home_season_win_pct,
+    away_season_win_pct,
+    home_goalie_sv_pct,
+    away_goalie_sv_pct,
+    home_special_avg,
+    away_special_avg,
+    h2h_home_win_pct,
+    h2h_games,
+    home_shots_per_game,
+    away_shots_per_game,
+    home_goal_diff_pg,
+    away_goal_diff_pg,
+    home_xg_per_game,
+    away_xg_per_game,
+    home_injury,
+    away_injury,
+):
+    """
+    Vectorized kernel: every argument is array-like of length N (one entry per
+    game); unknown goalie save percentages are NaN. Returns an ndarray of N
+    home-win probabilities. Semantics match the scalar wrapper exactly.
+    """
+    h_l10 = np.asarray(home_l10_win_pct, dtype=np.float64)
+    a_l10 = np.asarray(away_l10_win_pct, dtype=np.float64)
+    h_season = np.asarray(home_season_win_pct, dtype=np.float64)
+    a_season = np.asarray(away_season_win_pct, dtype=np.float64)
+    h_sv = np.asarray(home_goalie_sv_pct, dtype=np.float64)
+    a_sv = np.asarray(away_goalie_sv_pct, dtype=np.float64)
+    h_special = np.asarray(home_special_avg, dtype=np.float64)
+    a_special = np.asarray(away_special_avg, dtype=np.float64)
+    h2h = np.asarray(h2h_home_win_pct, dtype=np.float64)
+    h2h_n = np.asarray(h2h_games, dtype=np.int64)
+    h_shots = np.asarray(home_shots_per_game, dtype=np.float64)
+    a_shots = np.asarray(away_shots_per_game, dtype=np.float64)
+    h_gd = np.asarray(home_goal_diff_pg, dtype=np.float64)
+    a_gd = np.asarray(away_goal_diff_pg, dtype=np.float64)
+    h_xg = np.asarray(home_xg_per_game, dtype=np.float64)
+    a_xg = np.asarray(away_xg_per_game, dtype=np.float64)
+    h_inj = np.asarray(home_injury, dtype=np.float64)
+    a_inj = np.asarray(away_injury, dtype=np.float64)
+
+    goalie_diff = h_sv - a_sv
+    shot_diff = np.where((h_shots != 0) | (a_shots != 0), (h_shots - a_shots) / 15.0, 0.0)
+
+    # Stack one row per weighted factor (scaling/masking folded into the
+    # deltas), then apply all weights in a single dot product.
+    deltas = np.stack([
+        h_l10 - a_l10,                                            # last 10
+        h_season - a_season,                                      # season W-L
+        np.where(np.isnan(goalie_diff), 0.0, goalie_diff) * 10,   # goalie: .01 diff -> 0.1 prob shift
+        (h_special - a_special) * 5,                              # special teams
+        np.where(h2h_n > 0, (h2h - 0.5) * 2, 0.0),                # H2H: 1.0 -> +0.08, 0 -> -0.08
+        h_gd - a_gd,                                              # goal differential
+        np.clip(shot_diff, -1, 1),                                # shots (typical range ~22-35)
+        h_xg - a_xg,                                              # xG proxy
+        a_inj - h_inj,                                            # injuries (home more injured -> negative)
+    ])
+    prob = 0.5 + _WEIGHTS[0] + _WEIGHTS[1:] @ deltas
+
+    return np.clip(prob, 0.01, 0.99)
+
+
+def predict_slate(features) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute (probs, home_odds, away_odds) for an [N, 18] feature matrix
+    (column order per FEATURE_COLUMNS). Uses the numba-compiled parallel
+    kernel when available, otherwise the NumPy batch kernel.
+    """
+    features = np.ascontiguousarray(features, dtype=np.float64)
+    if _accel is not None:
+        return _accel.run_slate(features, _WEIGHTS, BOOK_MARGIN)
+    probs = predict_home_win_prob_batch(*features.T)
+    scale = 1.0 + BOOK_MARGIN
+    home_odds = np.array([probability_to_american_odds(p * scale) for p in probs], dtype=np.int64)
+    away_odds = np.array([probability_to_american_odds((1.0 - p) * scale) for p in probs], dtype=np.int64)
+    return probs, home_odds, away_odds
+
+
 def predict_home_win_prob(
     home_l10_win_pct: float,
     away_l10_win_pct: float,
@@ -71,41 +208,27 @@ def predict_home_win_prob(
     h2h_home_win_pct: home's win % in H2H games this season; use 0.5 if h2h_games==0.
     Shots per game: team shots for per game (proxy for shots/60).
     """
-    prob = 0.5 + HOME_ICE
-
-    # Last 10: delta
-    prob += WEIGHT_L10 * (home_l10_win_pct - away_l10_win_pct)
-
-    # Season W-L
-    prob += WEIGHT_SEASON * (home_season_win_pct - away_season_win_pct)
-
-    # Goalie save %
-    if home_goalie_sv_pct is not None and away_goalie_sv_pct is not None:
-        prob += WEIGHT_GOALIE * (home_goalie_sv_pct - away_goalie_sv_pct) * 10  # .01 diff -> 0.1 prob shift
-
-    # Special teams (already in 0..1 range typically; scale diff)
-    prob += WEIGHT_SPECIAL * (home_special_avg - away_special_avg) * 5
-
-    # Head-to-head this season (only if they've played)
-    if h2h_games > 0:
-        prob += WEIGHT_H2H * (h2h_home_win_pct - 0.5) * 2  # scale so 1.0 -> +0.08, 0 -> -0.08
-
-    # Goal differential per game
-    prob += WEIGHT_GOAL_DIFF * (home_goal_diff_pg - away_goal_diff_pg)
-
-    # Shots per game (normalize diff to ~-1..1: typical range ~22–35)
-    shot_diff = (home_shots_per_game - away_shots_per_game) / 15.0 if (home_shots_per_game or away_shots_per_game) else 0
-    prob += WEIGHT_SHOTS * _norm(shot_diff, -1, 1)
-
-    # Simple xG proxy based on shots (higher-volume teams get a small bump)
-    xg_diff = home_xg_per_game - away_xg_per_game
-    prob += WEIGHT_XG * xg_diff
-
-    # Injury flag: missing key players reduces that team's edge slightly
-    injury_delta = away_injury - home_injury  # if home is more injured, this is negative
-    prob += WEIGHT_INJURY * injury_delta
-
-    return _norm(prob, 0.01, 0.99)
+    probs = predict_home_win_prob_batch(
+        [home_l10_win_pct],
+        [away_l10_win_pct],
+        [home_season_win_pct],
+        [away_season_win_pct],
+        [np.nan if home_goalie_sv_pct is None else home_goalie_sv_pct],
+        [np.nan if away_goalie_sv_pct is None else away_goalie_sv_pct],
+        [home_special_avg],
+        [away_special_avg],
+        [h2h_home_win_pct],
+        [h2h_games],
+        [home_shots_per_game],
+        [away_shots_per_game],
+        [home_goal_diff_pg],
+        [away_goal_diff_pg],
+        [home_xg_per_game],
+        [away_xg_per_game],
+        [home_injury],
+        [away_injury],
+    )
+    return float(probs[0])
 
 
 def predict_game(
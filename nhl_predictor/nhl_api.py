@@ -1,28 +1,96 @@
 # FIXED: correct nhl_api module (no team_stats import)
-""" 
+"""
 Fetch NHL data from public APIs. No API key required (optional NHL_API_KEY in env).
 - Schedule: api-web.nhle.com
 - Standings: api-web.nhle.com (includes last-10 and season W-L)
 - Team stats (PP/PK, shots/game): api.nhle.com/stats
 - Goalie save %: api-web.nhle.com player landing
 - Head-to-head: api-web.nhle.com club-schedule-season
+
+All fetchers are async coroutines sharing one httpx.AsyncClient so requests
+reuse a keep-alive connection pool (HTTP/2 multiplexing when the server
+supports it) instead of paying a TCP+TLS handshake per call.
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
-import ssl
-import urllib.error
+import os
+import time
 import urllib.parse
-import urllib.request
 from datetime import date, datetime, timedelta
 
 import certifi
+import httpx
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - stdlib json fallback
+    orjson = None
 
 from . import config
+from .cache import SingleFlight, make_response_cache
+
+# TTLs (seconds) for the response cache. Schedules for today churn as games
+# start; future dates, standings and season aggregates move much slower.
+SCHEDULE_TTL_TODAY = 120
+SCHEDULE_TTL_FUTURE = 900
+STANDINGS_TTL = 600
+TEAM_STATS_TTL = 3600
+CLUB_SCHEDULE_TTL = 1800
+GOALIE_SV_TTL = 86400
+
+_response_cache = make_response_cache()
+_single_flight = SingleFlight()
+
+
+def _default_headers() -> dict[str, str]:
+    headers = {"User-Agent": "NHL-Predictor/1.0"}
+    if getattr(config, "NHL_API_KEY", None):
+        headers["Authorization"] = f"Bearer {config.NHL_API_KEY}"
+    return headers
+
 
-# Use certifi's certificate bundle so HTTPS works on macOS (avoids CERTIFICATE_VERIFY_FAILED)
-_SSL_CONTEXT = ssl.create_default_context(cafile=certifi.where())
+# Shared client: keep-alive pool + HTTP/2 so repeated NHL API calls reuse
+# one connection. certifi bundle so HTTPS works on macOS (avoids
+# CERTIFICATE_VERIFY_FAILED). Created lazily on first use so import never
+# binds it to the wrong event loop; close it via aclose() on shutdown.
+_client: httpx.AsyncClient | None = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None:
+        transport = httpx.AsyncHTTPTransport(
+            http2=True,
+            verify=certifi.where(),
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+            retries=3,  # connect-level retries with backoff
+        )
+        _client = httpx.AsyncClient(
+            transport=transport,
+            timeout=15,
+            headers=_default_headers(),
+        )
+    return _client
+
+
+async def aclose() -> None:
+    """Close the shared HTTP client (call from the app's shutdown hook)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+async def purge_expired_responses() -> int:
+    """Evict expired response-cache entries; return how many were dropped.
+
+    The cache accrues one entry per distinct URL (schedule weeks, goalie
+    landings, ...), so a long-lived server should call this periodically.
+    """
+    return await _response_cache.purge_expired()
 
 
 def _iso_utc_to_local_label(start_time_utc: str | None) -> str:
@@ -31,28 +99,89 @@ def _iso_utc_to_local_label(start_time_utc: str | None) -> str:
         return "TBD"
     s = start_time_utc.replace("Z", "+00:00")
     dt = datetime.fromisoformat(s).astimezone()  # system local tz
+    # Format by hand: strftime's %-I is platform-specific (raises on Windows),
+    # and the arithmetic is far cheaper than strftime either way.
+    h = dt.hour % 12 or 12
+    ampm = "AM" if dt.hour < 12 else "PM"
+    return f"{h}:{dt.minute:02d} {ampm}"
+
+
+async def _fetch(url: str):
+    r = await _get_client().get(url)
+    r.raise_for_status()
+    # orjson parses the large standings/team-summary bodies 2-5x faster
+    # than stdlib json; fall back transparently if it isn't installed.
+    if orjson is not None:
+        return orjson.loads(r.content)
+    return r.json()
+
+
+async def _get(url: str):
+    # Coalesce concurrent fetches of the same URL into a single request, so
+    # a burst of cold-cache callers can't stampede the NHL API.
+    return await _single_flight.do(url, lambda: _fetch(url))
+
+
+async def _cached_get(url: str, ttl: float):
+    """_get with a URL-keyed TTL cache in front of it."""
+    return await _response_cache.get_or_set(url, ttl, lambda: _get(url))
+
+
+def _read_disk_cache(path: str):
+    """Return the persisted JSON at path if it is fresh, else None."""
+    if config.NHL_CACHE_TTL <= 0:
+        return None
     try:
-        return dt.strftime("%-I:%M %p")  # mac/linux
-    except ValueError:
-        return dt.strftime("%I:%M %p").lstrip("0")  # fallback
+        if os.path.getmtime(path) + config.NHL_CACHE_TTL <= time.time():
+            return None
+        with open(path, "rb") as f:
+            raw = f.read()
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except (OSError, ValueError):
+        return None
 
 
-def _get(url: str):
-    headers = {"User-Agent": "NHL-Predictor/1.0"}
-    if getattr(config, "NHL_API_KEY", None):
-        headers["Authorization"] = f"Bearer {config.NHL_API_KEY}"
-    req = urllib.request.Request(url, headers=headers)
-    with urllib.request.urlopen(req, timeout=15, context=_SSL_CONTEXT) as resp:
-        return json.loads(resp.read().decode())
+def _write_disk_cache(path: str, data) -> None:
+    """Persist JSON atomically (tmp + rename) so readers never see partial files."""
+    if config.NHL_CACHE_TTL <= 0:
+        return
+    try:
+        os.makedirs(config.DATA_DIR, exist_ok=True)
+        tmp = f"{path}.tmp"
+        if orjson is not None:
+            with open(tmp, "wb") as f:
+                f.write(orjson.dumps(data))
+        else:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+        os.replace(tmp, path)
+    except OSError:
+        pass
 
 
-def get_schedule(for_date: date) -> list[dict]:
-    """Return list of scheduled games for the given date (future/upcoming)."""
-    url = f"{config.NHL_WEB_BASE}/schedule/{for_date.isoformat()}"
-    data = _get(url)
+async def _cached_get_persistent(url: str, ttl: float, path: str):
+    """_cached_get that also persists the body to disk for cold-start reuse."""
+
+    async def load():
+        # File I/O runs in a worker thread so it never blocks the event loop.
+        data = await asyncio.to_thread(_read_disk_cache, path)
+        if data is not None:
+            return data
+        data = await _get(url)
+        await asyncio.to_thread(_write_disk_cache, path, data)
+        return data
+
+    return await _response_cache.get_or_set(url, ttl, load)
+
 
+def schedule_is_cached(for_date: date) -> bool:
+    """True if the schedule for this date is already in the response cache."""
+    return _response_cache.has(f"{config.NHL_WEB_BASE}/schedule/{for_date.isoformat()}")
+
+
+def _parse_schedule_games(data) -> list[dict]:
+    """Extract all upcoming games from a /schedule/{date} payload (full week)."""
     games: list[dict] = []
-    target_date = for_date.isoformat()
 
     game_week = data.get("gameWeek") if isinstance(data, dict) else []
     for week in game_week or []:
@@ -81,7 +210,7 @@ def get_schedule(for_date: date) -> list[dict]:
             if not game_date and isinstance(start_time_utc, str) and "T" in start_time_utc:
                 game_date = start_time_utc.split("T", 1)[0]
 
-            if game_date != target_date:
+            if not game_date:
                 continue
 
             games.append({
@@ -98,16 +227,39 @@ def get_schedule(for_date: date) -> list[dict]:
     return games
 
 
-def get_schedule_range(start: date, end: date) -> list[dict]:
-    """Return scheduled games between start and end (inclusive)."""
+async def _get_schedule_week(start: date) -> list[dict]:
+    """Fetch the schedule page starting at `start` (the API returns a full week)."""
+    url = f"{config.NHL_WEB_BASE}/schedule/{start.isoformat()}"
+    ttl = SCHEDULE_TTL_TODAY if start <= date.today() else SCHEDULE_TTL_FUTURE
+    data = await _cached_get(url, ttl)
+    return _parse_schedule_games(data)
+
+
+async def get_schedule(for_date: date) -> list[dict]:
+    """Return list of scheduled games for the given date (future/upcoming)."""
+    target_date = for_date.isoformat()
+    games = await _get_schedule_week(for_date)
+    return [g for g in games if g["date"] == target_date]
+
+
+async def get_schedule_range(start: date, end: date) -> list[dict]:
+    """Return scheduled games between start and end (inclusive).
+
+    The schedule endpoint returns a whole week per page, so this fetches
+    ceil(days/7) pages instead of one request per day.
+    """
     if end < start:
         start, end = end, start
 
-    all_games: list[dict] = []
+    week_starts = []
     d = start
     while d <= end:
-        all_games.extend(get_schedule(d))
-        d += timedelta(days=1)
+        week_starts.append(d)
+        d += timedelta(days=7)
+
+    per_week = await asyncio.gather(*(_get_schedule_week(d) for d in week_starts))
+    lo, hi = start.isoformat(), end.isoformat()
+    all_games = [g for week in per_week for g in week if lo <= g["date"] <= hi]
 
     seen: set[int] = set()
     deduped: list[dict] = []
@@ -121,10 +273,15 @@ def get_schedule_range(start: date, end: date) -> list[dict]:
     return deduped
 
 
-def get_standings() -> dict:
-    """Return standings with last-10 and season W-L. Keyed by team abbrev."""
+async def _get_standings_raw() -> dict:
+    """Raw /standings/now payload; the single fetch path shared by all consumers."""
     url = f"{config.NHL_WEB_BASE}/standings/now"
-    data = _get(url)
+    return await _cached_get_persistent(url, STANDINGS_TTL, config.STANDINGS_CACHE_PATH)
+
+
+async def get_standings() -> dict:
+    """Return standings with last-10 and season W-L. Keyed by team abbrev."""
+    data = await _get_standings_raw()
     by_abbrev = {}
     for row in data.get("standings", []):
         abbrev = (row.get("teamAbbrev") or {}).get("default")
@@ -147,14 +304,15 @@ def get_standings() -> dict:
     return by_abbrev
 
 
-def get_team_stats_season() -> dict:
+async def get_team_stats_season() -> dict:
     """Return team summary stats including PP/PK. Keyed by team abbrev."""
     season_id = config.current_season_id()
     url = f"{config.NHL_STATS_BASE}/team/summary?limit=50&sort=gamesPlayed&order=desc&cayenneExp=gameTypeId=2%20and%20seasonId={season_id}"
-    data = _get(url)
+    data = await _cached_get_persistent(url, TEAM_STATS_TTL, config.TEAM_STATS_CACHE_PATH)
 
-    standings_url = f"{config.NHL_WEB_BASE}/standings/now"
-    stand_data = _get(standings_url)
+    # Reuse the standings fetch (cached + coalesced) purely for its
+    # name -> abbrev mapping; no second round trip.
+    stand_data = await _get_standings_raw()
     name_to_abbrev = {}
     for row in stand_data.get("standings", []):
         name = (row.get("teamName") or {}).get("default", "")
@@ -162,6 +320,8 @@ def get_team_stats_season() -> dict:
         if name and abbrev:
             name_to_abbrev[name] = abbrev
 
+    # Pull only the fields the model consumes from each summary row; the rest
+    # of the ~30-column payload is dropped in this single pass.
     by_abbrev = {}
     for row in data.get("data", []):
         full = row.get("teamFullName", "")
@@ -170,34 +330,88 @@ def get_team_stats_season() -> dict:
             continue
         pp = row.get("powerPlayPct") or 0
         pk = row.get("penaltyKillPct") or 0
+        gf = row.get("goalsForPerGame") or 0
+        ga = row.get("goalsAgainstPerGame") or 0
         by_abbrev[abbrev] = {
             "powerPlayPct": pp,
             "penaltyKillPct": pk,
             "specialTeamsAvg": (pp + pk) / 2.0,
+            "shotsForPerGame": row.get("shotsForPerGame"),
+            "goalsForPerGame": gf,
+            "goalsAgainstPerGame": ga,
+            "goalDiffPerGame": gf - ga,
         }
     return by_abbrev
 
 
-_club_schedule_cache: dict[str, list[dict]] = {}
-
-
-def get_club_schedule_season(team_abbrev: str) -> list[dict]:
-    key = team_abbrev.upper()
-    if key in _club_schedule_cache:
-        return _club_schedule_cache[key]
-    url = f"{config.NHL_WEB_BASE}/club-schedule-season/{key}/now"
+async def get_club_schedule_season(team_abbrev: str) -> list[dict]:
+    url = f"{config.NHL_WEB_BASE}/club-schedule-season/{team_abbrev.upper()}/now"
     try:
-        data = _get(url)
-    except urllib.error.HTTPError:
-        _club_schedule_cache[key] = []
+        data = await _cached_get_persistent(
+            url, CLUB_SCHEDULE_TTL, config.club_schedule_cache_path(team_abbrev)
+        )
+    except httpx.HTTPStatusError:
         return []
     games = data.get("games") or []
-    _club_schedule_cache[key] = games
     return games
 
 
-def get_h2h_win_pct(home_abbrev: str, away_abbrev: str) -> tuple[float, int]:
-    games = get_club_schedule_season(home_abbrev)
+async def build_h2h_index(abbrevs: set[str]) -> dict[tuple[str, str], tuple[int, int]]:
+    """
+    Build a season head-to-head index for the given teams in one pass.
+
+    Fetches each club schedule concurrently and walks it once, accumulating
+    completed regular-season matchups into {sorted (teamA, teamB): (wins for
+    the first team of the key, total games)}. Look results up with
+    h2h_from_index instead of re-scanning an 82-game schedule per pairing.
+    """
+    schedules = await asyncio.gather(*(get_club_schedule_season(a) for a in abbrevs))
+    season_id = config.current_season_id()
+    index: dict[tuple[str, str], tuple[int, int]] = {}
+    counted: set = set()
+    for games in schedules:
+        for g in games:
+            if g.get("gameType") != 2:
+                continue
+            if g.get("season") != season_id:
+                continue
+            state = (g.get("gameState") or "").upper()
+            if state not in ("OFF", "FINAL"):
+                continue
+            h = (g.get("homeTeam") or {}).get("abbrev") or ""
+            a = (g.get("awayTeam") or {}).get("abbrev") or ""
+            if not (h and a):
+                continue
+            h_score = (g.get("homeTeam") or {}).get("score")
+            a_score = (g.get("awayTeam") or {}).get("score")
+            if h_score is None or a_score is None:
+                continue
+            # The same game appears in both clubs' schedules; count it once.
+            gid = g.get("id") or (g.get("gameDate"), h, a)
+            if gid in counted:
+                continue
+            counted.add(gid)
+            key = (h, a) if h < a else (a, h)
+            wins, total = index.get(key, (0, 0))
+            winner = h if h_score > a_score else a
+            index[key] = (wins + (1 if winner == key[0] else 0), total + 1)
+    return index
+
+
+def h2h_from_index(
+    index: dict[tuple[str, str], tuple[int, int]], home_abbrev: str, away_abbrev: str
+) -> tuple[float, int]:
+    """Return (home team's H2H win %, games played) from a build_h2h_index result."""
+    key = (home_abbrev, away_abbrev) if home_abbrev < away_abbrev else (away_abbrev, home_abbrev)
+    wins, total = index.get(key, (0, 0))
+    if total == 0:
+        return 0.5, 0
+    home_wins = wins if home_abbrev == key[0] else total - wins
+    return home_wins / total, total
+
+
+async def get_h2h_win_pct(home_abbrev: str, away_abbrev: str) -> tuple[float, int]:
+    games = await get_club_schedule_season(home_abbrev)
     season_id = config.current_season_id()
     home_wins = 0
     total = 0
@@ -230,11 +444,12 @@ def get_h2h_win_pct(home_abbrev: str, away_abbrev: str) -> tuple[float, int]:
     return home_wins / total, total
 
 
-def get_goalie_save_pct(player_id: int) -> float | None:
+async def get_goalie_save_pct(player_id: int) -> float | None:
     url = f"{config.NHL_WEB_BASE}/player/{player_id}/landing"
     try:
-        data = _get(url)
-    except urllib.error.HTTPError:
+        # A goalie's season save % moves at most nightly; cache for 24h.
+        data = await _cached_get(url, GOALIE_SV_TTL)
+    except httpx.HTTPStatusError:
         return None
     featured = (data.get("featuredStats") or {}).get("regularSeason") or {}
     sub = featured.get("subSeason") or {}
@@ -242,12 +457,57 @@ def get_goalie_save_pct(player_id: int) -> float | None:
     return float(sv) if sv is not None else None
 
 
-def search_player_id(name: str) -> int | None:
+async def get_goalie_save_pcts(ids: set[int]) -> dict[int, float | None]:
+    """Fetch save % for many goalies concurrently. Returns {player_id: sv or None}."""
+    sem = asyncio.Semaphore(8)
+
+    async def one(pid: int) -> tuple[int, float | None]:
+        async with sem:
+            return pid, await get_goalie_save_pct(pid)
+
+    return dict(await asyncio.gather(*(one(pid) for pid in ids)))
+
+
+# Goalie name -> player id memo. The same ~60 NHL starters come up forever,
+# so resolved ids are kept on disk and consulted before the search endpoint.
+_name_id_map: dict[str, int] | None = None
+
+
+def _load_name_id_map() -> dict[str, int]:
+    global _name_id_map
+    if _name_id_map is None:
+        try:
+            with open(config.GOALIE_NAME_IDS_PATH, "rb") as f:
+                raw = f.read()
+            loaded = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            _name_id_map = {str(k): int(v) for k, v in loaded.items()}
+        except (OSError, ValueError):
+            _name_id_map = {}
+    return _name_id_map
+
+
+def _flush_name_id_map() -> None:
+    try:
+        os.makedirs(config.DATA_DIR, exist_ok=True)
+        tmp = f"{config.GOALIE_NAME_IDS_PATH}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(_name_id_map, f, indent=2, sort_keys=True)
+        os.replace(tmp, config.GOALIE_NAME_IDS_PATH)
+    except OSError:
+        pass
+
+
+async def search_player_id(name: str) -> int | None:
+    key = name.strip().lower()
+    name_ids = _load_name_id_map()
+    if key in name_ids:
+        return name_ids[key]
+
     q = urllib.parse.quote(name.strip())
     url = f"{config.NHL_SEARCH_BASE}?culture=en-us&limit=5&q={q}"
     try:
-        data = _get(url)
-    except urllib.error.HTTPError:
+        data = await _get(url)
+    except httpx.HTTPStatusError:
         return None
 
     players = data.get("data") if isinstance(data, dict) else data
@@ -258,5 +518,7 @@ def search_player_id(name: str) -> int | None:
         if isinstance(p, dict):
             pid = p.get("playerId")
             if pid:
+                name_ids[key] = pid
+                await asyncio.to_thread(_flush_name_id_map)
                 return pid
     return None
@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-""" 
+"""
 Run NHL game predictions and write odds for multiple upcoming dates.
 
 - By default, builds predictions for the next 14 days starting tomorrow.
@@ -14,103 +14,96 @@ Examples:
   python run_nhl_predictions.py 2026-02-25 --days 21
 """
 
+import asyncio
 from datetime import date, timedelta
 import sys
-import json
-import argparse
-from pathlib import Path
-
-from nhl_predictor.main import run_predictions
-
-# Simple ANSI colors per team (approximate primary colors)
-RESET = "\033[0m"
-BOLD = "\033[1m"
-
-TEAM_COLORS: dict[str, str] = {
-    # Eastern
-    "BOS": "\033[33m",  # yellow
-    "BUF": "\033[34m",
-    "DET": "\033[31m",
-    "FLA": "\033[31m",
-    "MTL": "\033[31m",
-    "OTT": "\033[31m",
-    "TBL": "\033[36m",
-    "TOR": "\033[34m",
-    "CAR": "\033[31m",
-    "CBJ": "\033[34m",
-    "NJD": "\033[31m",
-    "NYI": "\033[34m",
-    "NYR": "\033[34m",
-    "PHI": "\033[33m",
-    "PIT": "\033[33m",
-    "WSH": "\033[31m",
-    # Western
-    "ANA": "\033[33m",
-    "ARI": "\033[31m",
-    "CGY": "\033[31m",
-    "CHI": "\033[31m",
-    "COL": "\033[35m",
-    "DAL": "\033[32m",
-    "EDM": "\033[34m",
-    "LAK": "\033[37m",
-    "MIN": "\033[32m",
-    "NSH": "\033[33m",
-    "SEA": "\033[36m",
-    "SJS": "\033[36m",
-    "STL": "\033[34m",
-    "VAN": "\033[32m",
-    "VGK": "\033[33m",
-    "WPG": "\033[36m",
-}
-
-
-def color_team(abbrev: str) -> str:
-    code = TEAM_COLORS.get(abbrev.upper(), "\033[37m")
-    return f"{BOLD}{code}{abbrev}{RESET}"
-
-
-def write_predictions_multi(predictions: list[dict]) -> str:
-    """Write predictions in a multi-day JSON format for the static site."""
-    out_path = Path(__file__).resolve().parent / "nhl_data" / "predictions.json"
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-
-    payload = {
-        "generatedAt": date.today().isoformat(),
-        "predictions": predictions,
-    }
-
-    out_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
-    return str(out_path)
 
+from nhl_predictor.ansi import BOLD, RESET, color_team
 
-if __name__ == "__main__":
-    parser = argparse.ArgumentParser(add_help=False)
-    parser.add_argument("date", nargs="?", default=None, help="Start date (YYYY-MM-DD)")
-    parser.add_argument("--days", type=int, default=14, help="How many days to generate (default: 14)")
-    args, _ = parser.parse_known_args()
 
-    # Determine start date
-    if args.date:
+def _fmt_odds(o) -> str:
+    # Odds may be missing for far-future games the pipeline can't price yet.
+    # `o.__class__ is int` is a C-level identity check, cheaper than
+    # isinstance() for the thousands of calls a long window produces.
+    return f"{o:+5d}" if o.__class__ is int else "  N/A"
+
+
+def main(argv: list[str] | None = None) -> None:
+    # Hand-rolled arg parse: the trivial invocation only needs two values,
+    # and skipping argparse shaves its parser-construction cost off startup.
+    args = list(sys.argv[1:] if argv is None else argv)
+    days = 14
+    pretty = False
+    usage = "Usage: python run_nhl_predictions.py [YYYY-MM-DD] [--days N] [--pretty]"
+
+    # Determine start date (optional leading positional)
+    if args and not args[0].startswith("-"):
         try:
-            start_date = date.fromisoformat(args.date)
+            start_date = date.fromisoformat(args[0])
         except ValueError:
-            print("Usage: python run_nhl_predictions.py [YYYY-MM-DD] [--days N]")
+            print(usage)
             sys.exit(1)
+        args = args[1:]
     else:
         start_date = date.today() + timedelta(days=1)
 
-    days = max(1, min(int(args.days), 60))  # cap to keep runtime reasonable
+    # Flags: --pretty, --days N or --days=N. Anything else is a usage error
+    # rather than a silent no-op.
+    i = 0
+    while i < len(args):
+        a = args[i]
+        if a == "--pretty":
+            pretty = True
+        elif a == "--days" and i + 1 < len(args):
+            i += 1
+            days_arg = args[i]
+        elif a.startswith("--days="):
+            days_arg = a.partition("=")[2]
+        else:
+            print(usage)
+            sys.exit(1)
+        if a.startswith("--days"):
+            try:
+                days = int(days_arg)
+            except ValueError:
+                print("--days must be an integer")
+                sys.exit(1)
+        i += 1
+
+    days = max(1, min(days, 60))  # cap to keep runtime reasonable
+
+    # Deferred until the arguments are known-good: this pulls in the whole
+    # prediction stack (httpx, numpy, numba), so usage errors and importers
+    # that only want the ANSI helpers don't pay for it.
+    from nhl_predictor.main import cached_run_predictions, write_predictions_multi
+
+    # Accumulate the window's dates once with a single hoisted timedelta
+    # instead of re-allocating timedelta(days=i) per step.
+    one_day = timedelta(days=1)
+    dates: list[date] = []
+    d = start_date
+    for _ in range(days):
+        dates.append(d)
+        d += one_day
+
+    async def collect() -> list[dict]:
+        # Dates are independent; run up to 8 concurrently. gather preserves
+        # input order, so payloads line up with dates.
+        sem = asyncio.Semaphore(min(8, days))
+
+        async def one(day: date) -> dict:
+            async with sem:
+                return await cached_run_predictions(day)
+
+        return list(await asyncio.gather(*(one(day) for day in dates)))
 
     predictions: list[dict] = []
     total_games = 0
 
-    for i in range(days):
-        d = start_date + timedelta(days=i)
-        payload = run_predictions(d)
-
+    for day, payload in zip(dates, asyncio.run(collect())):
         # Normalize structure
         games = payload.get("games", []) or []
-        game_date = payload.get("date") or d.isoformat()
+        game_date = payload.get("date") or day.isoformat()
 
         predictions.append({
             "date": game_date,
@@ -118,23 +111,24 @@ if __name__ == "__main__":
         })
         total_games += len(games)
 
-    path = write_predictions_multi(predictions)
+    path = write_predictions_multi(predictions, pretty=pretty)
 
-    # Print a compact summary
-    print()
-    print("=" * 72)
+    # Build the compact summary in one buffer and emit it with a single
+    # write: one syscall instead of several prints per game.
+    buf: list[str] = []
     title = f"NHL PREDICTED ODDS — {start_date.isoformat()} (+{days-1} days)"
-    print(f"{BOLD}{title:^{72}}{RESET}")
-    print("=" * 72)
+    buf.append("\n" + "=" * 72 + "\n")
+    buf.append(f"{BOLD}{title:^{72}}{RESET}\n")
+    buf.append("=" * 72 + "\n")
 
     non_empty = [p for p in predictions if p.get("games")]
     if not non_empty:
-        print("  No games scheduled in this window.")
+        buf.append("  No games scheduled in this window.\n")
     else:
         for block in non_empty:
             game_date = block.get("date", "")
             games = block.get("games", [])
-            print(f"\n  {BOLD}{game_date}{RESET} — {len(games)} game(s)")
+            buf.append(f"\n  {BOLD}{game_date}{RESET} — {len(games)} game(s)\n")
             for j, g in enumerate(games, 1):
                 away = g.get("awayTeam")
                 home = g.get("homeTeam")
@@ -144,13 +138,16 @@ if __name__ == "__main__":
                 away_label = color_team(away) if away else "?"
                 home_label = color_team(home) if home else "?"
 
-                # Odds may be missing for far-future games if your pipeline can’t compute them yet
-                home_str = f"{home_odds:+5d}" if isinstance(home_odds, int) else "  N/A"
-                away_str = f"{away_odds:+5d}" if isinstance(away_odds, int) else "  N/A"
+                buf.append(
+                    f"    {j:2d}. {away_label} @ {home_label}   "
+                    f"Home: {_fmt_odds(home_odds)}  Away: {_fmt_odds(away_odds)}\n"
+                )
 
-                print(f"    {j:2d}. {away_label} @ {home_label}   Home: {home_str}  Away: {away_str}")
+    buf.append("\n" + "=" * 72 + "\n")
+    buf.append(f"  Wrote {len(predictions)} day(s), {total_games} total game(s) to {path}\n")
+    buf.append("=" * 72 + "\n\n")
+    sys.stdout.write("".join(buf))
 
-    print("\n" + "=" * 72)
-    print(f"  Wrote {len(predictions)} day(s), {total_games} total game(s) to {path}")
-    print("=" * 72)
-    print()
+
+if __name__ == "__main__":
+    main()